@@ -28,7 +28,7 @@ st.markdown(
     f"<h1 style='margin-bottom:0.2rem;'>Merchant Optimization Simulator</h1>"
     f"<p style='color:{GREEN}; font-size:14px; font-weight:500; margin-bottom:0.2rem;'>"
     f"Score &rarr; Segment &rarr; Optimize Fee &amp; Feed Placement</p>"
-    f"<p style='color:#757575; font-size:12px; margin-bottom:1.5rem;'>"
+    f"<p style='color:var(--brand-gray); font-size:12px; margin-bottom:1.5rem;'>"
     f"Jeremy Dubin &nbsp;&middot;&nbsp; DCO Regional Insights &amp; Analytics &nbsp;&middot;&nbsp; February 2026"
     f"</p>",
     unsafe_allow_html=True,
@@ -66,8 +66,8 @@ n1, n2, n3, n4 = st.columns(4)
 _card = (
     "<div style='background:#FAFAFA; border:1px solid #E0E0E0;"
     "border-left:3px solid #06C167; padding:1.2rem; border-radius:4px; height:100%;'>"
-    "<p style='font-weight:700; font-size:15px; color:#1A1A1A; margin:0 0 0.4rem 0;'>{title}</p>"
-    "<p style='font-size:13px; color:#757575; margin:0; line-height:1.5;'>{desc}</p>"
+    "<p style='font-weight:700; font-size:15px; color:var(--brand-dark); margin:0 0 0.4rem 0;'>{title}</p>"
+    "<p style='font-size:13px; color:var(--brand-gray); margin:0; line-height:1.5;'>{desc}</p>"
     "</div>"
 )
 
@@ -92,7 +92,7 @@ n4.markdown(_card.format(
 ), unsafe_allow_html=True)
 
 st.markdown(
-    "<p style='font-size:12px; color:#757575; margin-top:0.6rem;'>"
+    "<p style='font-size:12px; color:var(--brand-gray); margin-top:0.6rem;'>"
     "Use the sidebar to navigate between pages.</p>",
     unsafe_allow_html=True,
 )
@@ -140,7 +140,7 @@ with col_dl3:
                     'Volume_Score', 'Ops_Quality_Score', 'Economics_Score',
                 ]].to_csv(index=False),
             )
-            tier_summary = df_scored.groupby('Tier').agg({
+            tier_summary = df_scored.groupby('Tier', observed=True).agg({
                 'Brand Name': 'count',
                 'Estimated_Annual_Revenue': 'sum',
                 'Annualized Trips': 'sum',
@@ -10,6 +10,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 from utils.data_loader import load_restaurant_data
 from utils.scoring import calculate_total_score, get_top_n_merchants
 from utils.ui import render_header, render_sidebar, kpi_card, GREEN, DARK
+from utils.methodology import FORMULA_HTML
 
 render_header()
 render_sidebar()
@@ -29,7 +30,7 @@ top10 = get_top_n_merchants(df_scored, 10)
 # ─── Header ──────────────────────────────────────────────────────────────────
 st.title("Merchant Scoring")
 st.markdown(
-    "<p style='color:#757575; font-size:14px; margin-bottom:1.5rem;'>"
+    "<p style='color:var(--brand-gray); font-size:14px; margin-bottom:1.5rem;'>"
     "200 restaurant brands ranked across Volume, Ops Quality, and Economics "
     "using PERCENTRANK scoring to handle the skewed trip distribution.</p>",
     unsafe_allow_html=True,
@@ -38,7 +39,7 @@ st.markdown(
 # ─── Summary KPIs ────────────────────────────────────────────────────────────
 enterprise = df_scored[df_scored['Segment'] == 'Enterprise']
 smb        = df_scored[df_scored['Segment'] == 'SMB']
-tier_avgs  = df_scored.groupby('Tier')['Total_Score'].mean()
+tier_avgs  = df_scored.groupby('Tier', observed=True)['Total_Score'].mean()
 
 c1, c2, c3, c4, c5, c6 = st.columns(6)
 
@@ -223,17 +224,9 @@ st.dataframe(pd.DataFrame(summary_rows), use_container_width=True, hide_index=Tr
 
 # ─── Methodology expander ─────────────────────────────────────────────────────
 with st.expander("Scoring methodology"):
-    st.markdown("""
-    | Category | Points | Formula |
-    |---|---|---|
-    | **Volume** | 35 | `PERCENTRANK(Annualized Trips) × 35` |
-    | **Wait Time** | 18 | `(1 − PERCENTRANK(Wait Time)) × 18` |
-    | **Defect Rate** | 12 | `(1 − PERCENTRANK(Defect Rate)) × 12` |
-    | **Economics** | 35 | `PERCENTRANK(Basket × Fee) × 35` |
-    | **Total** | **100** | Sum of above |
-
-    PERCENTRANK normalises relative position across a right-skewed distribution,
-    giving each merchant a fair score regardless of outliers.
-
-    Tier assignment is rank-based: S = 1–10 · A = 11–50 · B = 51–150 · C = 151–200.
-    """)
+    st.html(FORMULA_HTML)
+    st.markdown(
+        "PERCENTRANK normalises relative position across a right-skewed distribution, "
+        "giving each merchant a fair score regardless of outliers.\n\n"
+        "Tier assignment is rank-based: S = 1–10 · A = 11–50 · B = 51–150 · C = 151–200."
+    )
@@ -10,7 +10,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 from utils.data_loader import load_restaurant_data
 from utils.scoring import calculate_total_score
 from utils.ui import render_header, render_sidebar, kpi_card, GREEN, RED, AMBER, DARK
-from utils.simulation import run_simulation, SS_DEFAULTS, init_session_state
+from utils.simulation import get_simulation, SS_DEFAULTS, init_session_state, market_share_pct
 
 render_header()
 render_sidebar()
@@ -28,7 +28,7 @@ df = calculate_total_score(df_raw)
 # ─── Header ──────────────────────────────────────────────────────────────────
 st.title("Fee Simulator")
 st.markdown(
-    "<p style='color:#757575; font-size:14px; margin-bottom:1.5rem;'>"
+    "<p style='color:var(--brand-gray); font-size:14px; margin-bottom:1.5rem;'>"
     "Simulate tiered fee adjustments and Feed placement volume lifts. "
     "Fee changes are relative to each merchant's current rate. "
     "Volume changes reflect Feed algorithm shifts, not fee elasticity.</p>",
@@ -72,35 +72,35 @@ with reset_col:
         st.rerun()
 
 st.markdown(
-    "<p style='font-size:13px; font-weight:500; color:#1A1A1A; margin:0.5rem 0 0.3rem 0;'>"
+    "<p style='font-size:13px; font-weight:500; color:var(--brand-dark); margin:0.5rem 0 0.3rem 0;'>"
     "Fee adjustments by tier (percentage points, relative to current fee)</p>",
     unsafe_allow_html=True,
 )
 fc1, fc2, fc3, fc4 = st.columns(4)
 
 with fc1:
-    st.markdown("<p style='font-size:13px; font-weight:600; color:#06C167; margin:0;'>S-tier — top 10</p>", unsafe_allow_html=True)
+    st.markdown("<p style='font-size:13px; font-weight:600; color:var(--tier-s); margin:0;'>S-tier — top 10</p>", unsafe_allow_html=True)
     st.slider("S-tier fee change (%pt)", min_value=-5.0, max_value=5.0, step=0.1,
               key='_widget_s_fee_change', format="%g%%", help="Default: −2pp",
               on_change=_sync, args=('s_fee_change', '_widget_s_fee_change'))
 with fc2:
-    st.markdown("<p style='font-size:13px; font-weight:600; color:#34A853; margin:0;'>A-tier — rank 11–50</p>", unsafe_allow_html=True)
+    st.markdown("<p style='font-size:13px; font-weight:600; color:var(--tier-a); margin:0;'>A-tier — rank 11–50</p>", unsafe_allow_html=True)
     st.slider("A-tier fee change (%pt)", min_value=-5.0, max_value=5.0, step=0.1,
               key='_widget_a_fee_change', format="%g%%", help="Default: −0.5pp",
               on_change=_sync, args=('a_fee_change', '_widget_a_fee_change'))
 with fc3:
-    st.markdown("<p style='font-size:13px; font-weight:600; color:#F9A825; margin:0;'>B-tier — rank 51–150</p>", unsafe_allow_html=True)
+    st.markdown("<p style='font-size:13px; font-weight:600; color:var(--tier-b); margin:0;'>B-tier — rank 51–150</p>", unsafe_allow_html=True)
     st.slider("B-tier fee change (%pt)", min_value=-5.0, max_value=5.0, step=0.1,
               key='_widget_b_fee_change', format="%g%%", help="Default: +2pp",
               on_change=_sync, args=('b_fee_change', '_widget_b_fee_change'))
 with fc4:
-    st.markdown("<p style='font-size:13px; font-weight:600; color:#D32F2F; margin:0;'>C-tier — rank 151–200</p>", unsafe_allow_html=True)
+    st.markdown("<p style='font-size:13px; font-weight:600; color:var(--tier-c); margin:0;'>C-tier — rank 151–200</p>", unsafe_allow_html=True)
     st.slider("C-tier fee change (%pt)", min_value=-5.0, max_value=5.0, step=0.1,
               key='_widget_c_fee_change', format="%g%%", help="Default: +3pp",
               on_change=_sync, args=('c_fee_change', '_widget_c_fee_change'))
 
 st.markdown(
-    "<p style='font-size:13px; font-weight:500; color:#1A1A1A; margin:0.8rem 0 0.3rem 0;'>"
+    "<p style='font-size:13px; font-weight:500; color:var(--brand-dark); margin:0.8rem 0 0.3rem 0;'>"
     "Volume assumptions by tier (Feed placement effect)</p>",
     unsafe_allow_html=True,
 )
@@ -126,19 +126,22 @@ with vc4:
 st.markdown("---")
 
 # ─── Simulation ──────────────────────────────────────────────────────────────
-sim, tier_fee, tier_vol = run_simulation(df)
-
-sim['Current Revenue'] = sim['Curr Rev']
-sim['Revenue Delta']   = sim['Rev Delta']
-sim['New Revenue']     = sim['New Rev']
-sim['Fee Change']      = sim['Fee Chg pp']
-sim['Fee Direction']   = sim['Fee Dir']
+sim, tier_fee, tier_vol = get_simulation(df)
+
+# Page-local aliases on a new frame — the shared simulation stays untouched
+sim = sim.assign(**{
+    'Current Revenue': sim['Curr Rev'],
+    'Revenue Delta':   sim['Rev Delta'],
+    'New Revenue':     sim['New Rev'],
+    'Fee Change':      sim['Fee Chg pp'],
+    'Fee Direction':   sim['Fee Dir'],
+})
 
 total_delta      = sim['Revenue Delta'].sum()
 total_curr_trips = sim['Annualized Trips'].sum()
 total_new_trips  = sim['New Trips'].sum()
 trip_change_pct  = (total_new_trips - total_curr_trips) / total_curr_trips * 100
-new_market_share = 0.18 * (1 + trip_change_pct / 100) * 100
+new_market_share = market_share_pct(total_curr_trips, total_new_trips)
 n_capped  = int(sim['Fee Capped'].sum())
 n_floored = int(sim['Fee Floored'].sum())
 
@@ -176,7 +179,7 @@ st.markdown("---")
 # ─── Waterfall Chart ──────────────────────────────────────────────────────────
 st.markdown("### Revenue Waterfall by Tier")
 
-tier_deltas = sim.groupby('Tier')['Revenue Delta'].sum()
+tier_deltas = sim.groupby('Tier', observed=True)['Revenue Delta'].sum()
 total_curr  = sim['Current Revenue'].sum()
 
 fig_wf = go.Figure(go.Waterfall(
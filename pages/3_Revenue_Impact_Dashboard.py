@@ -10,7 +10,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 from utils.data_loader import load_restaurant_data
 from utils.scoring import calculate_total_score
 from utils.ui import render_header, render_sidebar, kpi_card, GREEN, RED, AMBER, DARK
-from utils.simulation import run_simulation, is_at_defaults, init_session_state
+from utils.simulation import get_simulation, is_at_defaults, init_session_state, market_share_pct
 
 render_header()
 render_sidebar()
@@ -26,7 +26,7 @@ if df_raw.empty:
     st.stop()
 
 df = calculate_total_score(df_raw)
-sim, tier_fee, tier_vol = run_simulation(df)
+sim, tier_fee, tier_vol = get_simulation(df)
 
 total_curr   = sim['Curr Rev'].sum()
 total_new    = sim['New Rev'].sum()
@@ -34,14 +34,14 @@ total_delta  = sim['Rev Delta'].sum()
 curr_trips   = sim['Annualized Trips'].sum()
 new_trips    = sim['New Trips'].sum()
 trip_chg_pct = (new_trips - curr_trips) / curr_trips * 100
-new_mkt_share = 0.18 * (1 + trip_chg_pct / 100) * 100
+new_mkt_share = market_share_pct(curr_trips, new_trips)
 n_capped     = int(sim['Fee Capped'].sum())
 n_floored    = int(sim['Fee Floored'].sum())
 
 # ─── Header ──────────────────────────────────────────────────────────────────
 st.title("Revenue Impact")
 st.markdown(
-    "<p style='color:#757575; font-size:14px; margin-bottom:1.5rem;'>"
+    "<p style='color:var(--brand-gray); font-size:14px; margin-bottom:1.5rem;'>"
     "End-to-end view of the tiered fee strategy — revenue gain, where it comes from, "
     "and which merchants drive the outcome. Figures reflect current Fee Simulator settings.</p>",
     unsafe_allow_html=True,
@@ -85,7 +85,7 @@ st.markdown("")
 st.markdown("---")
 
 # ─── Revenue by Tier ──────────────────────────────────────────────────────────
-tier_rev = sim.groupby('Tier').agg(
+tier_rev = sim.groupby('Tier', observed=True).agg(
     Curr=('Curr Rev', 'sum'),
     New=('New Rev', 'sum'),
     Delta=('Rev Delta', 'sum'),
@@ -1,43 +1,161 @@
 import pandas as pd
 import numpy as np
 
-def calculate_current_revenue(df):
+from utils.scoring import TIERS, TIER_RANK_CUTS, tier_codes_from_rank
+
+# Rank-based tier boundaries (S 1–10, A 11–50, B 51–150, C 151+), shared
+# with utils.scoring so the two tier definitions can't drift
+TIER_BINS   = [0, *TIER_RANK_CUTS, np.inf]
+TIER_LABELS = [f'{t}-tier' for t in TIERS]
+
+# Presentation precision — compute functions return full precision; round
+# only when displaying or exporting. One schema per output shape, each
+# matching the rounding the function used to apply itself.
+
+# Per-brand frames: calculate_customer_ltv, calculate_restaurant_profitability,
+# calculate_cohort_retention
+DISPLAY_DECIMALS = {
+    'LTV_12_Month':                  2,
+    'CAC_Payback_Months':            1,
+    'LTV_CAC_Ratio':                 2,
+    'Lifetime_Margin':               2,
+    'Restaurant_Revenue_Per_Order':  2,
+    'Restaurant_Margin_Per_Order':   2,
+    'Restaurant_Annual_Profit':      0,
+    'Restaurant_Margin_Pct':         1,
+    'Fee_Reduction_To_10pct_Margin': 3,
+    'Monthly_Retention_Rate':        3,
+    'Retention_Month_3':             3,
+    'Retention_Month_6':             3,
+    'Retention_Month_12':            3,
+    'Expected_Lifetime_Months':      1,
+}
+
+# get_tier_summary (Revenue_Delta_Pct stays unrounded)
+TIER_SUMMARY_DECIMALS = {
+    'Current_Revenue':  2,
+    'New_Revenue':      2,
+    'Marketplace Fee':  2,
+    'New_Fee':          2,
+    'Annualized Trips': 2,
+    'New_Trips':        2,
+    'Revenue_Delta':    2,
+}
+
+# analyze_density_effects()['density_summary']
+DENSITY_SUMMARY_DECIMALS = {
+    'Avg. Basket Size':               2,
+    'Order Defect Rate':              2,
+    'Avg. Courier Wait Time (min)':   2,
+    '%Orders from First Time Eaters': 2,
+    'Annualized Trips':               2,
+}
+
+def format_for_display(df, schema=None):
+    """
+    Round columns for display.
+
+    Not called by the app yet — the pages render utils.simulation output,
+    not these frames. Use it wherever a calculation result is shown or
+    exported.
+
+    Args:
+        df (pd.DataFrame): Output of any calculation function
+        schema (dict): {column: decimals}; defaults to DISPLAY_DECIMALS.
+                       Pass TIER_SUMMARY_DECIMALS / DENSITY_SUMMARY_DECIMALS
+                       for the summary tables. Columns not in df are ignored.
+
+    Returns:
+        pd.DataFrame: Rounded copy of df
+    """
+    return df.round(DISPLAY_DECIMALS if schema is None else schema)
+
+def _columns(df, names):
+    """
+    Extract columns as C-contiguous NumPy arrays, once per function.
+
+    Columns of a frame built from F-ordered or sliced data can come back
+    strided; making them contiguous up front keeps later broadcasts and
+    reductions on NumPy's vectorised fast path without hidden copies.
+    """
+    return [np.ascontiguousarray(df[name].to_numpy()) for name in names]
+
+def _product(*columns):
+    """
+    Elementwise product of several columns with a single output allocation.
+
+    Multiplies left to right into one buffer, so a three-term product makes
+    one array instead of one temporary Series per binary op.
+    """
+    arrays = [np.asarray(c) for c in columns]
+    out = np.multiply(arrays[0], arrays[1], dtype=np.result_type(*arrays))
+    for arr in arrays[2:]:
+        np.multiply(out, arr, out=out)
+    return out
+
+def _rank_and_tier(df):
+    """
+    Rank brands by Total_Score and bin ranks into tiers.
+
+    Returns (rank, tier) where tier is an ordered Categorical over TIER_LABELS.
+    Without Total_Score every brand falls back to positional rank and C-tier.
+    """
+    if 'Total_Score' in df.columns:
+        rank = df['Total_Score'].rank(ascending=False, method='min').to_numpy(dtype=np.int32)
+        codes = tier_codes_from_rank(rank)
+    else:
+        rank = np.arange(1, len(df) + 1, dtype=np.int32)
+        codes = np.full(len(df), TIER_LABELS.index('C-tier'), dtype=np.int8)
+    tier = pd.Categorical.from_codes(codes, categories=TIER_LABELS, ordered=True)
+    return rank, tier
+
+def _tier_fees(tier, s_tier_fee, a_tier_fee, b_tier_fee, c_tier_fee):
+    """Index a per-tier fee array by the Tier category codes."""
+    # Trailing NaN catches code -1 (tier missing / not in TIER_LABELS)
+    fees = np.array([s_tier_fee, a_tier_fee, b_tier_fee, c_tier_fee, np.nan])
+    return fees[pd.Categorical(tier, categories=TIER_LABELS).codes]
+
+def _volume_change(fee_change, elasticity_decrease, elasticity_increase):
+    """
+    Volume impact of a relative fee change.
+
+    For fee decreases (negative change), volume increases:
+      each 5% decrease → elasticity_decrease% volume increase
+    For fee increases (positive change), volume decreases:
+      each 5% increase → elasticity_increase% volume decrease
+    """
+    elasticity = np.where(fee_change < 0, elasticity_decrease, elasticity_increase)
+    return -(fee_change / 0.05) * elasticity
+
+def calculate_current_revenue(df, copy=True):
     """
     Calculate current revenue from marketplace fees.
 
+    Entry point of the revenue pipeline — the only stage that copies by default.
+
     Args:
         df (pd.DataFrame): Restaurant brands dataset with Total_Score
+        copy (bool): Work on a copy of df instead of adding columns in place
 
     Returns:
         pd.DataFrame: DataFrame with current revenue and tier assignment
     """
-    df_rev = df.copy()
+    df_rev = df.copy() if copy else df
 
     # Calculate current annual revenue
-    df_rev['Current_Revenue'] = (
-        df_rev['Annualized Trips'] *
-        df_rev['Avg. Basket Size'] *
-        df_rev['Marketplace Fee']
+    df_rev['Current_Revenue'] = _product(
+        df_rev['Annualized Trips'],
+        df_rev['Avg. Basket Size'],
+        df_rev['Marketplace Fee'],
     )
 
-    # Assign tiers based on rank (requires Total_Score)
-    if 'Total_Score' in df_rev.columns:
-        df_rev['Rank'] = df_rev['Total_Score'].rank(ascending=False, method='min').astype(int)
-
-        # Assign tiers
-        df_rev['Tier'] = 'C-tier'  # Default
-        df_rev.loc[df_rev['Rank'] <= 10, 'Tier'] = 'S-tier'
-        df_rev.loc[(df_rev['Rank'] > 10) & (df_rev['Rank'] <= 50), 'Tier'] = 'A-tier'
-        df_rev.loc[(df_rev['Rank'] > 50) & (df_rev['Rank'] <= 150), 'Tier'] = 'B-tier'
-    else:
-        # Fallback if no scoring available
-        df_rev['Rank'] = range(1, len(df_rev) + 1)
-        df_rev['Tier'] = 'C-tier'
+    # Assign tiers based on rank (falls back to C-tier without Total_Score)
+    df_rev['Rank'], df_rev['Tier'] = _rank_and_tier(df_rev)
 
     return df_rev
 
 def apply_fee_changes(df, s_tier_fee=0.15, a_tier_fee=0.20, b_tier_fee=0.22, c_tier_fee=0.25,
-                     elasticity_decrease=0.20, elasticity_increase=0.10):
+                     elasticity_decrease=0.20, elasticity_increase=0.10, copy=False):
     """
     Apply fee changes based on tier and calculate volume impact.
 
@@ -49,21 +167,17 @@ def apply_fee_changes(df, s_tier_fee=0.15, a_tier_fee=0.20, b_tier_fee=0.22, c_t
         c_tier_fee (float): New fee for C-tier (default 25%)
         elasticity_decrease (float): Volume increase per 5% fee decrease (default 0.20 = 20%)
         elasticity_increase (float): Volume decrease per 5% fee increase (default 0.10 = 10%)
+        copy (bool): Work on a copy of df instead of adding columns in place
 
     Returns:
         pd.DataFrame: DataFrame with new fees and adjusted volumes
     """
-    df_modified = df.copy()
+    df_modified = df.copy() if copy else df
 
     # Map tier to new fee
-    tier_fees = {
-        'S-tier': s_tier_fee,
-        'A-tier': a_tier_fee,
-        'B-tier': b_tier_fee,
-        'C-tier': c_tier_fee
-    }
-
-    df_modified['New_Fee'] = df_modified['Tier'].map(tier_fees)
+    df_modified['New_Fee'] = _tier_fees(
+        df_modified['Tier'], s_tier_fee, a_tier_fee, b_tier_fee, c_tier_fee
+    )
 
     # Calculate fee change percentage
     df_modified['Fee_Change_Pct'] = (
@@ -71,59 +185,51 @@ def apply_fee_changes(df, s_tier_fee=0.15, a_tier_fee=0.20, b_tier_fee=0.22, c_t
     )
 
     # Calculate volume impact based on elasticity
-    # For fee decreases (negative change), volume increases
-    # For fee increases (positive change), volume decreases
-
-    def calculate_volume_change(fee_change):
-        if fee_change < 0:  # Fee decrease
-            # Each 5% decrease → elasticity_decrease% volume increase
-            volume_change = -(fee_change / 0.05) * elasticity_decrease
-        else:  # Fee increase
-            # Each 5% increase → elasticity_increase% volume decrease
-            volume_change = -(fee_change / 0.05) * elasticity_increase
-        return volume_change
+    volume_change = _volume_change(
+        df_modified['Fee_Change_Pct'].to_numpy(), elasticity_decrease, elasticity_increase
+    )
 
-    df_modified['Volume_Change_Pct'] = df_modified['Fee_Change_Pct'].apply(calculate_volume_change)
+    df_modified['Volume_Change_Pct'] = volume_change
 
     # Calculate new trips
-    df_modified['New_Trips'] = (
-        df_modified['Annualized Trips'] * (1 + df_modified['Volume_Change_Pct'])
-    )
+    df_modified['New_Trips'] = df_modified['Annualized Trips'].to_numpy() * (1 + volume_change)
 
     return df_modified
 
-def calculate_new_revenue(df_modified):
+def calculate_new_revenue(df_modified, copy=False):
     """
     Calculate new revenue after fee changes.
 
     Args:
         df_modified (pd.DataFrame): DataFrame with New_Fee and New_Trips
+        copy (bool): Work on a copy of df_modified instead of adding columns in place
 
     Returns:
         pd.DataFrame: DataFrame with new revenue calculated
     """
-    df_new = df_modified.copy()
+    df_new = df_modified.copy() if copy else df_modified
 
     # Calculate new revenue
-    df_new['New_Revenue'] = (
-        df_new['New_Trips'] *
-        df_new['Avg. Basket Size'] *
-        df_new['New_Fee']
+    df_new['New_Revenue'] = _product(
+        df_new['New_Trips'],
+        df_new['Avg. Basket Size'],
+        df_new['New_Fee'],
     )
 
     return df_new
 
-def calculate_revenue_delta(df_with_revenue):
+def calculate_revenue_delta(df_with_revenue, copy=False):
     """
     Calculate revenue delta between current and new scenarios.
 
     Args:
         df_with_revenue (pd.DataFrame): DataFrame with Current_Revenue and New_Revenue
+        copy (bool): Work on a copy of df_with_revenue instead of adding columns in place
 
     Returns:
         pd.DataFrame: DataFrame with delta columns added
     """
-    df_delta = df_with_revenue.copy()
+    df_delta = df_with_revenue.copy() if copy else df_with_revenue
 
     # Calculate absolute delta
     df_delta['Revenue_Delta'] = df_delta['New_Revenue'] - df_delta['Current_Revenue']
@@ -135,6 +241,52 @@ def calculate_revenue_delta(df_with_revenue):
 
     return df_delta
 
+def calculate_revenue_scenario(df, s_tier_fee=0.15, a_tier_fee=0.20, b_tier_fee=0.22, c_tier_fee=0.25,
+                               elasticity_decrease=0.20, elasticity_increase=0.10):
+    """
+    Run the full revenue scenario in one pass.
+
+    Equivalent to calculate_current_revenue → apply_fee_changes →
+    calculate_new_revenue → calculate_revenue_delta, but reads trips, basket
+    and fee once and adds every derived column in a single assign.
+
+    Args:
+        df (pd.DataFrame): Restaurant brands dataset with Total_Score
+        s_tier_fee (float): New fee for S-tier (default 15%)
+        a_tier_fee (float): New fee for A-tier (default 20%)
+        b_tier_fee (float): New fee for B-tier (default 22%)
+        c_tier_fee (float): New fee for C-tier (default 25%)
+        elasticity_decrease (float): Volume increase per 5% fee decrease (default 0.20 = 20%)
+        elasticity_increase (float): Volume decrease per 5% fee increase (default 0.10 = 10%)
+
+    Returns:
+        pd.DataFrame: Copy of df with current/new revenue, tier and delta columns
+    """
+    trips, basket, fee = _columns(df, ['Annualized Trips', 'Avg. Basket Size', 'Marketplace Fee'])
+
+    current_revenue = _product(trips, basket, fee)
+    rank, tier = _rank_and_tier(df)
+
+    new_fee = _tier_fees(tier, s_tier_fee, a_tier_fee, b_tier_fee, c_tier_fee)
+    fee_change = (new_fee - fee) / fee
+    volume_change = _volume_change(fee_change, elasticity_decrease, elasticity_increase)
+    new_trips = trips * (1 + volume_change)
+    new_revenue = _product(new_trips, basket, new_fee)
+    revenue_delta = new_revenue - current_revenue
+
+    return df.assign(
+        Current_Revenue=current_revenue,
+        Rank=rank,
+        Tier=tier,
+        New_Fee=new_fee,
+        Fee_Change_Pct=fee_change,
+        Volume_Change_Pct=volume_change,
+        New_Trips=new_trips,
+        New_Revenue=new_revenue,
+        Revenue_Delta=revenue_delta,
+        Revenue_Delta_Pct=revenue_delta / current_revenue * 100,
+    )
+
 def get_tier_summary(df):
     """
     Get summary statistics by tier.
@@ -145,17 +297,15 @@ def get_tier_summary(df):
     Returns:
         pd.DataFrame: Summary by tier
     """
-    summary = df.groupby('Tier').agg({
-        'Brand Name': 'count',
-        'Current_Revenue': 'sum',
-        'New_Revenue': 'sum',
-        'Marketplace Fee': 'mean',
-        'New_Fee': 'mean',
-        'Annualized Trips': 'sum',
-        'New_Trips': 'sum'
-    }).round(2)
-
-    summary = summary.rename(columns={'Brand Name': 'Brand_Count'})
+    summary = df.groupby('Tier', observed=True, sort=False).agg(**{
+        'Brand_Count':      ('Brand Name', 'count'),
+        'Current_Revenue':  ('Current_Revenue', 'sum'),
+        'New_Revenue':      ('New_Revenue', 'sum'),
+        'Marketplace Fee':  ('Marketplace Fee', 'mean'),
+        'New_Fee':          ('New_Fee', 'mean'),
+        'Annualized Trips': ('Annualized Trips', 'sum'),
+        'New_Trips':        ('New_Trips', 'sum'),
+    })
 
     # Calculate deltas
     summary['Revenue_Delta'] = summary['New_Revenue'] - summary['Current_Revenue']
@@ -163,9 +313,8 @@ def get_tier_summary(df):
         (summary['New_Revenue'] - summary['Current_Revenue']) / summary['Current_Revenue']
     ) * 100
 
-    # Reorder tiers
-    tier_order = ['S-tier', 'A-tier', 'B-tier', 'C-tier']
-    summary = summary.reindex([t for t in tier_order if t in summary.index])
+    # Order tiers S → C (only those present)
+    summary = summary.loc[[t for t in TIER_LABELS if t in summary.index]]
 
     return summary
 
@@ -185,11 +334,18 @@ def calculate_baseline_economics(df, delivery_fee=2.50, courier_cost=5.00,
     Returns:
         dict: Baseline economics
     """
-    total_orders = df['Annualized Trips'].sum()
-    avg_basket = (df['Annualized Trips'] * df['Avg. Basket Size']).sum() / total_orders
+    trips, basket, fee = _columns(df, ['Annualized Trips', 'Avg. Basket Size', 'Marketplace Fee'])
+
+    # Fused reductions — no intermediate per-brand products are materialised.
+    # Accumulate in float64 whatever the input dtype (int64 trips, narrower
+    # floats from a caller) so totals keep full precision at hundreds of
+    # millions of trips.
+    total_orders = trips.sum(dtype=np.float64)
+    gmv = np.einsum('i,i->', trips, basket, dtype=np.float64)
+    avg_basket = gmv / total_orders
 
     # Revenue
-    marketplace_revenue = (df['Annualized Trips'] * df['Avg. Basket Size'] * df['Marketplace Fee']).sum()
+    marketplace_revenue = np.einsum('i,i,i->', trips, basket, fee, dtype=np.float64)
     delivery_revenue = total_orders * delivery_fee
     total_revenue = marketplace_revenue + delivery_revenue
 
@@ -365,49 +521,125 @@ def calculate_combined_scenario(baseline, delivery_fee_increase, defect_reductio
         'delta': new_contribution_margin - baseline['contribution_margin']
     }
 
-def calculate_revenue_per_brand(df):
+def calculate_combined_scenario_grid(baseline, delivery_fee_increases, defect_reduction_pcts,
+                                     efficiency_gain_pcts):
+    """
+    Evaluate calculate_combined_scenario over a full parameter grid at once.
+
+    The three parameter vectors are broadcast against each other, so a sweep
+    of I × J × K scenarios is one NumPy expression instead of I·J·K calls.
+
+    Args:
+        baseline (dict): Baseline economics
+        delivery_fee_increases (array-like): Delivery fee increases, length I
+        defect_reduction_pcts (array-like): Defect reduction percentages, length J
+        efficiency_gain_pcts (array-like): Efficiency gain percentages, length K
+
+    Returns:
+        dict: total_revenue, total_costs, contribution_margin, margin_pct and
+              delta, each an (I, J, K) array indexed [fee, defect, efficiency]
+    """
+    delivery_fee_increase = np.asarray(delivery_fee_increases, dtype=np.float64)[:, None, None]
+    defect_reduction_pct  = np.asarray(defect_reduction_pcts, dtype=np.float64)[None, :, None]
+    efficiency_gain_pct   = np.asarray(efficiency_gain_pcts, dtype=np.float64)[None, None, :]
+
+    # Same formulas as calculate_combined_scenario, broadcast over the grid
+    new_total_orders = baseline['total_orders'] * (1 + efficiency_gain_pct)
+    new_delivery_fee = baseline['delivery_fee'] + delivery_fee_increase
+    new_defect_rate = baseline['defect_rate'] * (1 - defect_reduction_pct)
+
+    # Revenue
+    new_marketplace_revenue = baseline['marketplace_revenue'] * (1 + efficiency_gain_pct)
+    new_total_revenue = new_marketplace_revenue + new_total_orders * new_delivery_fee
+
+    # Costs
+    new_courier_costs = baseline['courier_costs'] * (1 + efficiency_gain_pct)
+    new_refund_costs = new_total_orders * new_defect_rate * baseline['avg_refund']
+    new_total_costs = new_courier_costs + new_refund_costs + baseline['platform_costs']
+
+    # Margin
+    new_contribution_margin = new_total_revenue - new_total_costs
+    new_margin_pct = np.divide(
+        new_contribution_margin * 100, new_total_revenue,
+        out=np.zeros_like(new_contribution_margin), where=new_total_revenue > 0,
+    )
+
+    # Revenue and costs don't depend on every axis — expand them to real
+    # (writable) arrays so all five keys share the full grid shape
+    grid_shape = new_contribution_margin.shape
+    return {
+        'total_revenue': np.broadcast_to(new_total_revenue, grid_shape).copy(),
+        'total_costs': np.broadcast_to(new_total_costs, grid_shape).copy(),
+        'contribution_margin': new_contribution_margin,
+        'margin_pct': new_margin_pct,
+        'delta': new_contribution_margin - baseline['contribution_margin']
+    }
+
+def _revenue_per_trip(df, reuse_derived=False):
+    """Take-rate revenue per trip (basket × fee); reuses Revenue_Per_Trip only on opt-in."""
+    if reuse_derived and 'Revenue_Per_Trip' in df.columns:
+        return df['Revenue_Per_Trip']
+    return df['Avg. Basket Size'] * df['Marketplace Fee']
+
+def calculate_revenue_per_brand(df, copy=True, reuse_derived=False):
     """
     Calculate revenue metrics per brand.
 
+    Derived columns are recomputed from the raw inputs by default, since a
+    column already on df may predate a change to trips, basket or fee. For
+    repeated scenario runs over a frame enriched once upstream and not
+    modified since, pass reuse_derived=True to keep existing columns as-is.
+
     Args:
         df (pd.DataFrame): Restaurant brands dataset
+        copy (bool): Work on a copy of df instead of adding columns in place
+        reuse_derived (bool): Keep Annual_Revenue / Revenue_Per_Active_Location /
+                              Revenue_Per_Trip if already present (caller
+                              guarantees they are current)
 
     Returns:
         pd.DataFrame: DataFrame with added revenue columns
     """
-    df_calc = df.copy()
+    df_calc = df.copy() if copy else df
 
     # Calculate annual revenue from marketplace fees
-    df_calc['Annual_Revenue'] = (
-        df_calc['Annualized Trips'] *
-        df_calc['Avg. Basket Size'] *
-        df_calc['Marketplace Fee']
-    )
+    if not (reuse_derived and 'Annual_Revenue' in df_calc.columns):
+        df_calc['Annual_Revenue'] = _product(
+            df_calc['Annualized Trips'],
+            df_calc['Avg. Basket Size'],
+            df_calc['Marketplace Fee'],
+        )
 
     # Calculate revenue per location
-    df_calc['Revenue_Per_Active_Location'] = (
-        df_calc['Annual_Revenue'] / df_calc['Active Locations']
-    )
+    if not (reuse_derived and 'Revenue_Per_Active_Location' in df_calc.columns):
+        df_calc['Revenue_Per_Active_Location'] = (
+            df_calc['Annual_Revenue'] / df_calc['Active Locations']
+        )
 
     # Calculate revenue per trip
-    df_calc['Revenue_Per_Trip'] = (
-        df_calc['Avg. Basket Size'] * df_calc['Marketplace Fee']
-    )
+    df_calc['Revenue_Per_Trip'] = _revenue_per_trip(df_calc, reuse_derived)
 
     return df_calc
 
-def optimize_marketplace_fee(df, target_revenue_change=0.0):
+def optimize_marketplace_fee(df, target_revenue_change=0.0, copy=True, reuse_derived=False):
     """
     Analyze marketplace fee optimization opportunities.
 
+    For repeated scenario runs, enrich the frame once with
+    calculate_revenue_per_brand and pass copy=False, reuse_derived=True: the
+    per-brand revenue columns are then reused as-is and no frame copy is
+    made per call.
+
     Args:
         df (pd.DataFrame): Restaurant brands dataset
         target_revenue_change (float): Target revenue change percentage (e.g., 0.05 for 5% increase)
+        copy (bool): Work on a copy of df instead of adding columns in place
+        reuse_derived (bool): See calculate_revenue_per_brand
 
     Returns:
         pd.DataFrame: DataFrame with fee optimization recommendations
     """
-    df_opt = calculate_revenue_per_brand(df)
+    df_opt = calculate_revenue_per_brand(df, copy=copy, reuse_derived=reuse_derived)
 
     # Price elasticity assumptions (can be customized based on business knowledge)
     # Assume -1.5 elasticity (1% fee increase leads to 1.5% trip decrease)
@@ -419,42 +651,44 @@ def optimize_marketplace_fee(df, target_revenue_change=0.0):
     # Simulate fee changes from -5% to +5% in 0.5% increments
     fee_changes = np.arange(-0.05, 0.06, 0.005)
 
-    # For each brand, find the fee change that maximizes revenue
-    optimal_fees = []
-    for idx, row in df_opt.iterrows():
-        current_revenue = row['Annual_Revenue']
-        current_fee = row['Marketplace Fee']
-        current_trips = row['Annualized Trips']
-
-        max_revenue = current_revenue
-        optimal_fee = current_fee
-        optimal_trips = current_trips
-
-        for fee_change in fee_changes:
-            new_fee = current_fee * (1 + fee_change)
-            # Estimate trip change based on elasticity
-            trip_change = fee_change * elasticity
-            new_trips = current_trips * (1 + trip_change)
-            new_revenue = new_trips * row['Avg. Basket Size'] * new_fee
-
-            if new_revenue > max_revenue:
-                max_revenue = new_revenue
-                optimal_fee = new_fee
-                optimal_trips = new_trips
-
-        optimal_fees.append({
-            'Optimal_Fee': optimal_fee,
-            'Optimal_Fee_Pct': optimal_fee * 100,
-            'Fee_Change_Pct': ((optimal_fee - current_fee) / current_fee) * 100,
-            'Projected_Trips': optimal_trips,
-            'Projected_Revenue': max_revenue,
-            'Revenue_Change': max_revenue - current_revenue,
-            'Revenue_Change_Pct': ((max_revenue - current_revenue) / current_revenue) * 100
-        })
-
-    # Add optimal fee columns to dataframe
-    optimal_df = pd.DataFrame(optimal_fees)
-    df_opt = pd.concat([df_opt, optimal_df], axis=1)
+    # For each brand, find the fee change that maximizes revenue.
+    # Running best per brand, vectorised across brands and looped over the 22
+    # candidate changes — O(brands) memory, no (brands × changes) temporaries.
+    # A brand keeps its current fee unless a change strictly beats its revenue.
+    current_revenue, current_fee, current_trips, basket = _columns(
+        df_opt, ['Annual_Revenue', 'Marketplace Fee', 'Annualized Trips', 'Avg. Basket Size']
+    )
+
+    # Running-best buffers are float64 whatever the input dtype — Annualized
+    # Trips loads as int64, and copyto can't write float candidates into it
+    max_revenue   = current_revenue.astype(np.float64)
+    optimal_fee   = current_fee.astype(np.float64)
+    optimal_trips = current_trips.astype(np.float64)
+
+    for fee_change in fee_changes:
+        new_fee = current_fee * (1 + fee_change)
+        # Estimate trip change based on elasticity
+        new_trips = current_trips * (1 + fee_change * elasticity)
+        new_revenue = _product(new_trips, basket, new_fee)
+
+        better = new_revenue > max_revenue
+        np.copyto(max_revenue, new_revenue, where=better)
+        np.copyto(optimal_fee, new_fee, where=better)
+        np.copyto(optimal_trips, new_trips, where=better)
+
+    # Add optimal fee columns to dataframe (direct assignment — no
+    # intermediate frame or concat)
+    optimal_columns = {
+        'Optimal_Fee': optimal_fee,
+        'Optimal_Fee_Pct': optimal_fee * 100,
+        'Fee_Change_Pct': ((optimal_fee - current_fee) / current_fee) * 100,
+        'Projected_Trips': optimal_trips,
+        'Projected_Revenue': max_revenue,
+        'Revenue_Change': max_revenue - current_revenue,
+        'Revenue_Change_Pct': ((max_revenue - current_revenue) / current_revenue) * 100
+    }
+    for name, values in optimal_columns.items():
+        df_opt[name] = values
 
     return df_opt
 
@@ -547,10 +781,10 @@ def simulate_growth_scenarios(df, growth_assumptions):
     df_growth['Projected_Basket_Size'] = df_growth['Avg. Basket Size'] * (1 + basket_growth)
 
     # Recalculate revenue with growth
-    df_growth['Projected_Revenue'] = (
-        df_growth['Projected_Trips'] *
-        df_growth['Projected_Basket_Size'] *
-        df_growth['Marketplace Fee']
+    df_growth['Projected_Revenue'] = _product(
+        df_growth['Projected_Trips'],
+        df_growth['Projected_Basket_Size'],
+        df_growth['Marketplace Fee'],
     )
 
     # Calculate revenue uplift
@@ -591,11 +825,7 @@ def calculate_customer_ltv(df, retention_assumptions=None):
     avg_orders_per_month = 2.5  # Industry benchmark
 
     # Calculate monthly contribution margin per customer
-    monthly_contribution = (
-        avg_orders_per_month *
-        df_ltv['Avg. Basket Size'] *
-        df_ltv['Marketplace Fee']
-    )
+    monthly_contribution = avg_orders_per_month * _revenue_per_trip(df_ltv)
 
     # Calculate 12-month LTV using retention curve
     # LTV = Sum of (monthly_contribution * retention_rate) for each month
@@ -608,7 +838,7 @@ def calculate_customer_ltv(df, retention_assumptions=None):
         )
     )
 
-    df_ltv['LTV_12_Month'] = ltv_12_month.round(2)
+    df_ltv['LTV_12_Month'] = ltv_12_month
 
     # Calculate Customer Acquisition Cost (CAC)
     # Assume acquisition cost is concentrated in first-time orders
@@ -617,12 +847,12 @@ def calculate_customer_ltv(df, retention_assumptions=None):
     # Calculate CAC Payback Period (months)
     df_ltv['CAC_Payback_Months'] = (
         df_ltv['CAC'] / monthly_contribution
-    ).round(1)
+    )
 
     # Calculate LTV:CAC Ratio (target: > 3.0)
     df_ltv['LTV_CAC_Ratio'] = (
         df_ltv['LTV_12_Month'] / df_ltv['CAC']
-    ).round(2)
+    )
 
     # Flag healthy unit economics
     df_ltv['Healthy_LTV'] = df_ltv['LTV_CAC_Ratio'] > 3.0
@@ -630,7 +860,7 @@ def calculate_customer_ltv(df, retention_assumptions=None):
     # Calculate lifetime margin
     df_ltv['Lifetime_Margin'] = (
         df_ltv['LTV_12_Month'] - df_ltv['CAC']
-    ).round(2)
+    )
 
     return df_ltv
 
@@ -652,13 +882,17 @@ def analyze_density_effects(df):
         df_density['Active Locations'] / df_density['Active Locations'].mean()
     )
 
-    # Calculate correlations
-    correlations = {
-        'Density_vs_Basket_Size': df_density[['Location_Density_Score', 'Avg. Basket Size']].corr().iloc[0, 1],
-        'Density_vs_Defect_Rate': df_density[['Location_Density_Score', 'Order Defect Rate']].corr().iloc[0, 1],
-        'Density_vs_Wait_Time': df_density[['Location_Density_Score', 'Avg. Courier Wait Time (min)']].corr().iloc[0, 1],
-        'Density_vs_FTO_Rate': df_density[['Location_Density_Score', '%Orders from First Time Eaters']].corr().iloc[0, 1]
+    # Calculate correlations — one correlation matrix over density + the four
+    # metrics; row 0 holds density vs each metric. DataFrame.corr drops
+    # incomplete rows pairwise, so a NaN in one metric doesn't blank the others
+    metrics = {
+        'Density_vs_Basket_Size': 'Avg. Basket Size',
+        'Density_vs_Defect_Rate': 'Order Defect Rate',
+        'Density_vs_Wait_Time': 'Avg. Courier Wait Time (min)',
+        'Density_vs_FTO_Rate': '%Orders from First Time Eaters',
     }
+    density_corr = df_density[['Location_Density_Score', *metrics.values()]].corr().iloc[0]
+    correlations = {name: density_corr[col] for name, col in metrics.items()}
 
     # Create density tiers
     df_density['Density_Tier'] = pd.qcut(
@@ -668,14 +902,14 @@ def analyze_density_effects(df):
     )
 
     # Aggregate metrics by density tier
-    density_summary = df_density.groupby('Density_Tier').agg({
+    density_summary = df_density.groupby('Density_Tier', observed=True).agg({
         'Avg. Basket Size': 'mean',
         'Order Defect Rate': 'mean',
         'Avg. Courier Wait Time (min)': 'mean',
         '%Orders from First Time Eaters': 'mean',
         'Annualized Trips': 'sum',
         'Brand Name': 'count'
-    }).round(2)
+    })
 
     return {
         'correlations': correlations,
@@ -701,7 +935,7 @@ def calculate_restaurant_profitability(df):
     avg_order_value = df_restaurant['Avg. Basket Size']
 
     # Uber Eats takes marketplace fee
-    marketplace_fee_amount = avg_order_value * df_restaurant['Marketplace Fee']
+    marketplace_fee_amount = _revenue_per_trip(df_restaurant)
 
     # Restaurant receives
     restaurant_revenue_per_order = avg_order_value - marketplace_fee_amount
@@ -721,14 +955,14 @@ def calculate_restaurant_profitability(df):
     restaurant_annual_profit = restaurant_margin * df_restaurant['Annualized Trips']
 
     # Add to dataframe
-    df_restaurant['Restaurant_Revenue_Per_Order'] = restaurant_revenue_per_order.round(2)
-    df_restaurant['Restaurant_Margin_Per_Order'] = restaurant_margin.round(2)
-    df_restaurant['Restaurant_Annual_Profit'] = restaurant_annual_profit.round(0)
+    df_restaurant['Restaurant_Revenue_Per_Order'] = restaurant_revenue_per_order
+    df_restaurant['Restaurant_Margin_Per_Order'] = restaurant_margin
+    df_restaurant['Restaurant_Annual_Profit'] = restaurant_annual_profit
 
     # Calculate restaurant margin %
     df_restaurant['Restaurant_Margin_Pct'] = (
         (restaurant_margin / avg_order_value) * 100
-    ).round(1)
+    )
 
     # Flag at-risk merchants (negative margin or < 5% margin)
     df_restaurant['At_Risk'] = (restaurant_margin < 0) | (df_restaurant['Restaurant_Margin_Pct'] < 5)
@@ -739,7 +973,7 @@ def calculate_restaurant_profitability(df):
     target_revenue_to_restaurant = avg_order_value * (1 - target_margin_pct) - total_restaurant_costs
 
     required_fee_reduction = (target_revenue_to_restaurant - current_revenue_to_restaurant) / avg_order_value
-    df_restaurant['Fee_Reduction_To_10pct_Margin'] = required_fee_reduction.clip(lower=0).round(3)
+    df_restaurant['Fee_Reduction_To_10pct_Margin'] = required_fee_reduction.clip(lower=0)
 
     return df_restaurant
 
@@ -765,19 +999,24 @@ def calculate_cohort_retention(df, cohort_months=12):
         (1 - df_cohort['Order Defect Rate']) * 0.10  # Lower defects = +10% retention
     )
 
-    monthly_retention_rate = (base_retention + quality_bonus).clip(upper=0.95)
+    monthly_retention_rate = (base_retention + quality_bonus).clip(upper=0.95).to_numpy()
+
+    df_cohort['Monthly_Retention_Rate'] = monthly_retention_rate
 
-    df_cohort['Monthly_Retention_Rate'] = monthly_retention_rate.round(3)
+    # Calculate retention at Month 3, 6, 12 — chained squaring reuses each
+    # power instead of three separate pow() evaluations
+    retention_3 = monthly_retention_rate * monthly_retention_rate * monthly_retention_rate
+    retention_6 = retention_3 * retention_3
+    retention_12 = retention_6 * retention_6
 
-    # Calculate retention at Month 3, 6, 12
-    df_cohort['Retention_Month_3'] = (monthly_retention_rate ** 3).round(3)
-    df_cohort['Retention_Month_6'] = (monthly_retention_rate ** 6).round(3)
-    df_cohort['Retention_Month_12'] = (monthly_retention_rate ** 12).round(3)
+    df_cohort['Retention_Month_3'] = retention_3
+    df_cohort['Retention_Month_6'] = retention_6
+    df_cohort['Retention_Month_12'] = retention_12
 
     # Calculate expected customer lifetime (in months)
     # Lifetime = 1 / (1 - retention_rate)
     df_cohort['Expected_Lifetime_Months'] = (
         1 / (1 - monthly_retention_rate)
-    ).round(1)
+    )
 
     return df_cohort
@@ -1,14 +1,21 @@
+import os
 import pandas as pd
 import numpy as np
 import streamlit as st
 from pathlib import Path
 
+from utils.scoring import TIERS
+
 # ─── Primary data source: CSV exported from the VSCode scoring model tab ─────
 _CSV_FILE    = "[Model] Resturant Brands Scoring Model_VSCode.csv"
 # ─── Fallback Excel workbook (demographic data only) ─────────────────────────
 _DATA_FILE   = "[2026 Business Case] Insights & Analytics- Restaurant Brands Data Sheet_JD_W_Calculations.xlsx"
 _DEMO_SHEET  = "RAW Demographic Data"
 
+# Code a cached frame depends on besides its source file: this loader, and
+# scoring.py for TIERS (the Tier categories)
+_SIDECAR_DEPS = (Path(__file__), Path(__file__).with_name("scoring.py"))
+
 # Columns that contain formatted currency strings → strip $ and , → float
 _DOLLAR_COLS = {
     'Avg. Basket Size', 'Current Rev',
@@ -24,6 +31,31 @@ _COMMA_INT_COLS = {
     'Annualized Trips', 'Active Locations', 'Total Locations', 'New Trips',
 }
 
+# CSV column → app-standard name
+_RENAME = {
+    'Type':                  'Segment',
+    'Rev / Order (Helper)':  'Rev per Order',
+    'Volume Score':          'Volume_Score',
+    'Wait Time Score':       'Wait_Time_Score',
+    'Defect Score':          'Defect_Rate_Score',
+    'Quality Score Total':   'Ops_Quality_Score',
+    'Econ Score':            'Economics_Score',
+    'Total Score':           'Total_Score',
+    'Current Rev':           'Estimated_Annual_Revenue',
+    'Target Fee':            'Target_Fee_Default',
+    'Fee Change':            'Fee_Change_Default',
+    'New Trips':             'New_Trips_Default',
+    'New Rev / Order':       'New_Rev_Per_Order_Default',
+    'New Revenue':           'New_Revenue_Default',
+    'Revenue Delta':         'Revenue_Delta_Default',
+}
+
+# Every CSV column the app reads; anything else in the export is skipped at parse
+_CSV_COLS = (
+    _DOLLAR_COLS | _PCT_COLS | _COMMA_INT_COLS | set(_RENAME)
+    | {'Brand Name', 'Tier', 'Rank', 'Avg. Courier Wait Time (min)'}
+)
+
 # Default slider values (must match DEFAULTS in pages 2 & 3)
 SLIDER_DEFAULTS = {
     'fee_s': -2.0, 'fee_a': -0.5, 'fee_b': 2.0,  'fee_c':  3.0,
@@ -35,7 +67,8 @@ def _clean_dollar(series: pd.Series) -> pd.Series:
     """Remove $ and commas from a currency-formatted string column → float."""
     return (
         series.astype(str)
-              .str.replace(r'[\$,]', '', regex=True)
+              .str.replace('$', '', regex=False)
+              .str.replace(',', '', regex=False)
               .str.strip()
               .pipe(pd.to_numeric, errors='coerce')
     )
@@ -62,7 +95,32 @@ def _clean_comma_int(series: pd.Series) -> pd.Series:
     )
 
 
-@st.cache_data
+def _sidecar_is_fresh(sidecar: Path, source: Path) -> bool:
+    """True if the Parquet sidecar is newer than its source file and every
+    module in _SIDECAR_DEPS (so parsing or TIERS changes invalidate it too)."""
+    if not sidecar.exists():
+        return False
+    newest_input = max(p.stat().st_mtime for p in (source, *_SIDECAR_DEPS))
+    return sidecar.stat().st_mtime >= newest_input
+
+
+def _write_sidecar(df: pd.DataFrame, sidecar: Path) -> None:
+    """Best-effort Parquet write — a read-only deploy just re-parses next time.
+
+    Skipped outright when data/ isn't writable, so read-only deploys don't
+    retry the write on every cold start. Only environment failures are
+    swallowed (no Parquet engine, I/O errors); anything else is a real bug
+    and propagates.
+    """
+    if not os.access(sidecar.parent, os.W_OK):
+        return
+    try:
+        df.to_parquet(sidecar, index=False)
+    except (ImportError, OSError):
+        pass
+
+
+@st.cache_resource
 def load_restaurant_data():
     """
     Load pre-calculated merchant data from the VSCode scoring model CSV.
@@ -72,49 +130,51 @@ def load_restaurant_data():
     pre-calculated simulation at the standard slider defaults:
         S: −2pp / +20%   A: −0.5pp / +10%   B: +2pp / −5%   C: +3pp / −15%
 
+    Cached as a process-wide singleton: every session gets the same frame, with
+    no per-call unpickle. Treat it as read-only — copy before adding columns
+    (calculate_total_score already does).
+
     Returns:
         pd.DataFrame: 200 rows, all scoring + revenue columns ready to use.
     """
     try:
         csv_path = Path(__file__).parent.parent / "data" / _CSV_FILE
-        # dtype=str so we can clean the formatted values ourselves
-        df = pd.read_csv(csv_path, header=0, dtype=str)
+        parquet_path = csv_path.with_suffix('.parquet')
+
+        # Warm start: reuse the typed Parquet sidecar if still fresh
+        if _sidecar_is_fresh(parquet_path, csv_path):
+            return pd.read_parquet(parquet_path)
+
+        # dtype=str so we can clean the formatted values ourselves; only the
+        # columns in _CSV_COLS are parsed (headers compared stripped)
+        df = pd.read_csv(csv_path, header=0, dtype=str,
+                         usecols=lambda c: c.strip() in _CSV_COLS)
 
         # Strip whitespace from column names and any stray blank rows
         df.columns = df.columns.str.strip()
         df = df.dropna(how='all').reset_index(drop=True)
 
-        # ── Parse formatted value columns ─────────────────────────────────────
-        for col in _DOLLAR_COLS:
-            if col in df.columns:
-                df[col] = _clean_dollar(df[col])
-
-        for col in _PCT_COLS:
-            if col in df.columns:
-                df[col] = _clean_pct(df[col])
-
-        for col in _COMMA_INT_COLS:
-            if col in df.columns:
-                df[col] = _clean_comma_int(df[col])
+        # ── Parse formatted value columns (cleaned, then assigned in one pass) ─
+        cleaners = (
+            (_DOLLAR_COLS,    _clean_dollar),
+            (_PCT_COLS,       _clean_pct),
+            (_COMMA_INT_COLS, _clean_comma_int),
+        )
+        df = df.assign(**{
+            col: clean(df[col])
+            for cols, clean in cleaners
+            for col in cols
+            if col in df.columns
+        })
 
         # ── Rename CSV columns → app-standard names ───────────────────────────
-        df = df.rename(columns={
-            'Type':                  'Segment',
-            'Rev / Order (Helper)':  'Rev per Order',
-            'Volume Score':          'Volume_Score',
-            'Wait Time Score':       'Wait_Time_Score',
-            'Defect Score':          'Defect_Rate_Score',
-            'Quality Score Total':   'Ops_Quality_Score',
-            'Econ Score':            'Economics_Score',
-            'Total Score':           'Total_Score',
-            'Current Rev':           'Estimated_Annual_Revenue',
-            'Target Fee':            'Target_Fee_Default',
-            'Fee Change':            'Fee_Change_Default',
-            'New Trips':             'New_Trips_Default',
-            'New Rev / Order':       'New_Rev_Per_Order_Default',
-            'New Revenue':           'New_Revenue_Default',
-            'Revenue Delta':         'Revenue_Delta_Default',
-        })
+        df = df.rename(columns=_RENAME)
+
+        # ── Small label sets → categoricals (int8 codes; Tier in S→C order) ───
+        if 'Segment' in df.columns:
+            df['Segment'] = df['Segment'].astype('category')
+        if 'Tier' in df.columns:
+            df['Tier'] = pd.Categorical(df['Tier'], categories=TIERS, ordered=True)
 
         # ── Ops_Quality_Score is pre-calculated in the CSV; derive only if missing ──
         if 'Ops_Quality_Score' not in df.columns and {'Wait_Time_Score', 'Defect_Rate_Score'}.issubset(df.columns):
@@ -133,17 +193,27 @@ def load_restaurant_data():
                 df[col] = pd.to_numeric(df[col], errors='coerce')
 
         # ── Legacy derived columns (kept for page compatibility) ──────────────
-        df['Revenue_Per_Trip']         = df['Avg. Basket Size'] * df['Marketplace Fee']
-        df['Location_Activation_Rate'] = (
-            df['Active Locations'] / df['Total Locations']
-        ).fillna(0).round(4)
-        df['Is_Franchised']            = df['% Franchised'] > 0.5
+        # Computed on the raw arrays in place: one buffer per column, no
+        # intermediate Series for the fillna/round steps
+        df['Revenue_Per_Trip'] = np.multiply(
+            df['Avg. Basket Size'].to_numpy(), df['Marketplace Fee'].to_numpy()
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            activation = np.divide(
+                df['Active Locations'].to_numpy(dtype=float),
+                df['Total Locations'].to_numpy(dtype=float),
+            )
+        activation[np.isnan(activation)] = 0
+        df['Location_Activation_Rate'] = np.round(activation, 4, out=activation)
+        # Nullable boolean: a missing % Franchised stays <NA> instead of False
+        df['Is_Franchised'] = df['% Franchised'].astype('Float64') > 0.5
 
-        # Fill any residual nulls in numeric columns with median
-        for col in df.select_dtypes(include=[np.number]).columns:
-            if df[col].isnull().any():
-                df[col] = df[col].fillna(df[col].median())
+        # Fill any residual nulls in numeric columns with median (0 if a
+        # column is entirely null, so no NaN reaches the simulation)
+        num_cols = df.select_dtypes(include=[np.number]).columns
+        df[num_cols] = df[num_cols].fillna(df[num_cols].median().fillna(0))
 
+        _write_sidecar(df, parquet_path)
         return df
 
     except FileNotFoundError:
@@ -159,19 +229,21 @@ def load_demographic_data():
     """Load Demographic Data sheet from the same workbook."""
     try:
         data_path = Path(__file__).parent.parent / "data" / _DATA_FILE
+        parquet_path = data_path.with_suffix('.demographic.parquet')
+        if _sidecar_is_fresh(parquet_path, data_path):
+            return pd.read_parquet(parquet_path)
+
         df = pd.read_excel(data_path, sheet_name=_DEMO_SHEET)
         df.columns = df.columns.str.strip()
 
+        # Column groups resolved once up front; the fills don't change dtypes
         numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            if df[col].isnull().any():
-                df[col] = df[col].fillna(df[col].median())
+        cat_cols     = df.select_dtypes(include=['object']).columns
 
-        cat_cols = df.select_dtypes(include=['object']).columns
-        for col in cat_cols:
-            if df[col].isnull().any():
-                df[col] = df[col].fillna('Unknown')
+        df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].median())
+        df[cat_cols]     = df[cat_cols].fillna('Unknown')
 
+        _write_sidecar(df, parquet_path)
         return df
     except FileNotFoundError:
         st.error(f"Data file not found. Expected: data/{_DATA_FILE}")
@@ -0,0 +1,100 @@
+"""Static Methodology content — tables and page body pre-rendered to HTML once per process."""
+from markdown_it import MarkdownIt
+
+_md = MarkdownIt("commonmark").enable("table")
+
+# ── Scoring formula (single source for Methodology + Merchant Scoring) ────────
+# (component, max points, formula, direction)
+FORMULA_ROWS = (
+    ("Volume",      35, "PERCENTRANK(Annualized Trips) × 35",   "Higher trips → higher score"),
+    ("Wait Time",   18, "(1 − PERCENTRANK(Wait Time)) × 18",    "Lower wait → higher score"),
+    ("Defect Rate", 12, "(1 − PERCENTRANK(Defect Rate)) × 12",  "Lower defect → higher score"),
+    ("Economics",   35, "PERCENTRANK(Basket × Fee) × 35",       "Higher rev/order → higher score"),
+)
+
+# ── Source tables (markdown) ──────────────────────────────────────────────────
+VARIABLES_TABLE_MD = """
+| Variable | Decision | Reason |
+|---|---|---|
+| Annualized Trips | In — Volume (35 pts) | Most direct signal of consumer demand and merchant importance. |
+| Avg. Courier Wait Time | In — Ops Quality (18 pts) | Lower wait time correlates with better retention and repeat orders. |
+| Order Defect Rate | In — Ops Quality (12 pts) | Directly measures experience quality; lower is unambiguously better. |
+| Basket Size × Fee | In — Economics (35 pts) | Revenue per order — captures fee level without making scoring circular. |
+| First-Time Eater % | Excluded | High % could mean rapid growth or high churn; direction is unclear. |
+| Location Activation Rate | Excluded | Low activation is either a growth opportunity or an operational failure — ambiguous. |
+| % Franchised | Excluded | Franchised vs. corporate doesn't indicate performance; it indicates account management type. |
+| Fee Rate alone | Excluded | Fee is set in Phase 3. Scoring on it creates a circular dependency. |
+| Active Locations | Excluded | Used only for the Enterprise/SMB split. Including it in scoring double-counts scale. |
+"""
+
+
+# ── Page prose (markdown) ─────────────────────────────────────────────────────
+_SCORING_NOTES_MD = """
+Trip volume is heavily right-skewed — a few brands have 1M+ annualized trips.
+Min-max normalization would let 3 merchants dominate the score. Percentile rank
+compresses this into a relative ranking where every merchant's position reflects
+how they compare to the full set.
+
+**Variables in vs out**
+"""
+
+_ASSUMPTIONS_MD = """
+Enterprise = 20+ active locations.
+Tiers are rank-based (S: 1–10, A: 11–50, B: 51–150, C: 151–200), not score-threshold-based.
+
+---
+
+## Fee Simulator Assumptions
+
+The simulator models two parallel levers applied in Phase 3: fee restructuring changes
+what Uber earns per trip, Feed reordering changes how many trips each merchant gets.
+These are independent — the fee adjustment doesn't cause the volume change.
+
+Volume shifts reflect Feed promotion and deprioritization, not fee elasticity.
+Eaters don't see the marketplace fee — it's a B2B rate between Uber Eats and the restaurant.
+A fee increase on a C-tier merchant doesn't reduce consumer demand. The volume lift for
+S/A tiers is intentionally larger than the loss for B/C because promoting top merchants
+drives outsized gains.
+
+Revenue = Annualized Trips × Avg. Basket Size × Marketplace Fee.
+This is Uber Eats take-rate revenue, not restaurant gross revenue.
+Market share = 18% × (1 + trip growth %).
+"""
+
+
+def _render_table(markdown: str) -> str:
+    """Render a markdown table to an HTML block styled by the global .mc-table rules."""
+    return f"<div class='mc-table'>{_md.render(markdown)}</div>"
+
+
+def _render_formula_table() -> str:
+    """Build the scoring formula table directly from FORMULA_ROWS."""
+    rows = "".join(
+        f"<tr><td><strong>{name}</strong></td><td>{pts}</td>"
+        f"<td><code>{formula}</code></td><td>{direction}</td></tr>"
+        for name, pts, formula, direction in FORMULA_ROWS
+    )
+    total = sum(pts for _, pts, _, _ in FORMULA_ROWS)
+    return (
+        "<div class='mc-table'><table>"
+        "<thead><tr><th>Component</th><th>Max Pts</th><th>Formula</th><th>Direction</th></tr></thead>"
+        f"<tbody>{rows}"
+        f"<tr><td><strong>Total</strong></td><td><strong>{total}</strong></td>"
+        "<td>Sum of above</td><td>—</td></tr>"
+        "</tbody></table></div>"
+    )
+
+
+# ── Pre-rendered HTML (built once at import, reused on every rerun) ───────────
+FORMULA_HTML   = _render_formula_table()
+VARIABLES_HTML = _render_table(VARIABLES_TABLE_MD)
+
+# Entire Methodology page body below the title — nothing on it is dynamic.
+METHODOLOGY_HTML = "".join((
+    "<p class='mc-subtitle'>What's in the model, what's out, and why.</p>",
+    _md.render("## Scoring Model"),
+    FORMULA_HTML,
+    _md.render(_SCORING_NOTES_MD),
+    VARIABLES_HTML,
+    _md.render(_ASSUMPTIONS_MD),
+))
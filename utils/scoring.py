@@ -1,6 +1,19 @@
 import pandas as pd
 import numpy as np
-from scipy.stats import percentileofscore
+
+from utils.config import CONFIG
+
+
+# Tier labels, best first — category order for the Tier column
+TIERS = ['S', 'A', 'B', 'C']
+
+# Last rank in each tier except C, which takes the rest (S 1–10, A 11–50, B 51–150)
+TIER_RANK_CUTS = [CONFIG['tier_cutoffs'][t] for t in TIERS[:-1]]
+
+
+def tier_codes_from_rank(rank) -> np.ndarray:
+    """Index into TIERS per rank (rank ≤ 10 → 0 = S, … , > 150 → 3 = C)."""
+    return np.searchsorted(TIER_RANK_CUTS, rank, side='left').astype(np.int8)
 
 
 # ─── PERCENTRANK helper ───────────────────────────────────────────────────────
@@ -9,12 +22,37 @@ def _prank(series: pd.Series, kind: str = "rank") -> pd.Series:
     """
     Vectorised PERCENTRANK equivalent (mirrors Excel PERCENTRANK.INC).
     Returns values in [0, 1].
+
+    Same result as scipy.stats.percentileofscore(arr, v, kind) for every v,
+    but computed from one sort + two binary searches (O(n log n)) instead of
+    a full scan per value (O(n²)). Like scipy's default nan_policy='propagate',
+    any missing value makes the whole result NaN — np.sort would otherwise
+    park NaN last and hand that brand the top percentile.
     """
-    arr = series.values
-    return pd.Series(
-        [percentileofscore(arr, v, kind=kind) / 100 for v in arr],
-        index=series.index
-    )
+    arr = series.to_numpy(dtype=float, na_value=np.nan)
+    n = len(arr)
+    if n == 0:
+        return pd.Series(np.empty(0), index=series.index)
+
+    sorted_arr = np.sort(arr)
+    left  = np.searchsorted(sorted_arr, arr, side='left')    # count(a <  v)
+    right = np.searchsorted(sorted_arr, arr, side='right')   # count(a <= v)
+
+    if kind == "rank":
+        pct = (left + right + (right > left)) * (50.0 / n)
+    elif kind == "weak":
+        pct = right * (100.0 / n)
+    elif kind == "strict":
+        pct = left * (100.0 / n)
+    elif kind == "mean":
+        pct = (left + right) * (50.0 / n)
+    else:
+        raise ValueError("kind can only be 'rank', 'strict', 'weak' or 'mean'")
+
+    if np.isnan(arr).any():
+        pct = np.full(n, np.nan)
+
+    return pd.Series(pct / 100, index=series.index)
 
 
 # ─── Component score functions ────────────────────────────────────────────────
@@ -115,20 +153,23 @@ def calculate_total_score(df: pd.DataFrame) -> pd.DataFrame:
         .astype(int)
     )
 
-    def _tier(rank):
-        if rank <= 10:   return 'S'
-        elif rank <= 50:  return 'A'
-        elif rank <= 150: return 'B'
-        return 'C'
-
-    df_scored['Tier'] = df_scored['Rank'].apply(_tier)
+    df_scored['Tier'] = pd.Categorical.from_codes(
+        tier_codes_from_rank(df_scored['Rank'].to_numpy()), categories=TIERS, ordered=True
+    )
     return df_scored
 
 
 # ─── Utility helpers ──────────────────────────────────────────────────────────
 
-def get_top_n_merchants(df_scored: pd.DataFrame, n: int = 10) -> pd.DataFrame:
-    return df_scored.nsmallest(n, 'Rank')
+def get_top_n_merchants(df_scored: pd.DataFrame, n: int = 10, by: str = 'Rank') -> pd.DataFrame:
+    """
+    Top n merchants by partial selection (no full sort).
+    by='Rank' keeps the spreadsheet's rank order (it breaks Total_Score ties);
+    by='Total_Score' needs no Rank column at all.
+    """
+    if by == 'Rank':
+        return df_scored.nsmallest(n, 'Rank')
+    return df_scored.nlargest(n, by)
 
 
 def get_score_color(score: float) -> str:
@@ -13,12 +13,31 @@ init_session_state() initialises these keys if absent (safe to call on every pag
 run_simulation() reads them, divides by 100 for the revenue formula, and enforces
 a hard fee floor of 10% and cap of 30% per the case study specification.
 """
+import numpy as np
+import pandas as pd
 import streamlit as st
 
+from utils.scoring import TIERS
+
 # ── Fee bounds (case study requirement) ───────────────────────────────────────
 FEE_FLOOR = 0.10   # 10% minimum marketplace fee
 FEE_CAP   = 0.30   # 30% maximum marketplace fee
 
+# ── Market share baseline (case study: 18% today) ─────────────────────────────
+BASE_MARKET_SHARE = 0.18
+
+# ── Fee direction arrows, code = sign(fee adjustment) + 1 ──────────────────────
+FEE_DIRECTIONS = ['\u2193', '\u2014', '\u2191']   # ↓ — ↑
+
+# ── Columns carried from load_restaurant_data() into every simulation result ──
+SIM_INPUT_COLS = [
+    'Brand Name', 'Segment', 'Tier', 'Rank',
+    'Annualized Trips', 'Avg. Basket Size', 'Marketplace Fee',
+    'Active Locations', 'Estimated_Annual_Revenue',
+    'Target_Fee_Default', 'New_Trips_Default',
+    'New_Revenue_Default', 'Revenue_Delta_Default',
+]
+
 # ── Defaults in percentage-point format (matches slider display) ───────────────
 SS_DEFAULTS = {
     's_fee_change': -2.0,
@@ -30,6 +49,8 @@ SS_DEFAULTS = {
     'b_volume':     -5.0,
     'c_volume':    -15.0,
 }
+_SS_KEYS          = tuple(SS_DEFAULTS)
+_SS_DEFAULT_TUPLE = tuple(SS_DEFAULTS.values())
 
 
 def init_session_state():
@@ -46,7 +67,35 @@ def init_session_state():
 def is_at_defaults():
     """Return True if every session-state value equals its default."""
     ss = st.session_state
-    return all(ss.get(k, v) == v for k, v in SS_DEFAULTS.items())
+    return tuple(ss.get(k, v) for k, v in zip(_SS_KEYS, _SS_DEFAULT_TUPLE)) == _SS_DEFAULT_TUPLE
+
+
+def market_share_pct(curr_trips, new_trips):
+    """
+    Estimated market share (%) after the scenario: 18% × (1 + trip growth).
+    Written as 18% × new / current — the same value without the growth-% round trip.
+    """
+    return BASE_MARKET_SHARE * new_trips / curr_trips * 100
+
+
+def get_simulation(df):
+    """
+    run_simulation() memoised in session state on the 8 slider values, so
+    reruns that don't move a slider (other widgets, navigating back to a
+    page) reuse the last result instead of simulating again.
+
+    ``df`` must be load_restaurant_data() output (or a scored pass-through of
+    it) — the memo is keyed on the scenario only. Treat the returned frame as
+    read-only; it is the same object on every hit.
+    """
+    ss  = st.session_state
+    sig = tuple(ss.get(k, v) for k, v in zip(_SS_KEYS, _SS_DEFAULT_TUPLE))
+    cached = ss.get('_last_sim')
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    result = run_simulation(df)
+    ss['_last_sim'] = (sig, result)
+    return result
 
 
 def run_simulation(df):
@@ -79,7 +128,7 @@ def run_simulation(df):
           Rev Delta %     — Rev Delta / Curr Rev * 100
           Fee Chg pp      — intended fee adjustment in percentage points (pre-clamp)
           Vol Lift %      — volume assumption in percentage points
-          Fee Dir         — '↑' / '↓' / '—'
+          Fee Dir         — '↑' / '↓' / '—' (categorical over FEE_DIRECTIONS)
           Fee Capped      — True if this merchant hit the 30% cap
           Fee Floored     — True if this merchant hit the 10% floor
 
@@ -100,32 +149,51 @@ def run_simulation(df):
     tier_fee = {'S': fee_s, 'A': fee_a, 'B': fee_b, 'C': fee_c}
     tier_vol = {'S': vol_s, 'A': vol_a, 'B': vol_b, 'C': vol_c}
 
-    sim = df[[
-        'Brand Name', 'Segment', 'Tier', 'Rank',
-        'Annualized Trips', 'Avg. Basket Size', 'Marketplace Fee',
-        'Active Locations', 'Estimated_Annual_Revenue',
-        'Target_Fee_Default', 'New_Trips_Default',
-        'New_Revenue_Default', 'Revenue_Delta_Default',
-    ]].copy()
-
-    sim['Curr Rev']   = sim['Estimated_Annual_Revenue']
-    sim['Fee Chg pp'] = sim['Tier'].map(tier_fee) * 100   # intended adjustment (pre-clamp)
-    sim['Vol Lift %'] = sim['Tier'].map(tier_vol) * 100
-    sim['Fee Dir']    = sim['Tier'].map(tier_fee).apply(
-        lambda x: '\u2191' if x > 0 else ('\u2193' if x < 0 else '\u2014')
-    )
+    return simulate_tiers(df, tier_fee, tier_vol), tier_fee, tier_vol
+
+
+def simulate_tiers(df, tier_fee, tier_vol):
+    """
+    Core of run_simulation() with the tier assumptions passed in explicitly
+    (decimal form), so callers can run it without touching session state.
+
+    Returns the ``sim`` frame described in run_simulation().
+    """
+    # Input columns are read, never written: the derived columns are built as
+    # arrays and joined onto the slice in a single construction at the end.
+    base = df[SIM_INPUT_COLS]
+
+    # Gather each merchant's tier assumptions once via the tier codes; the
+    # trailing NaN slot is picked by code -1 (tier missing or unrecognised)
+    tier_codes = pd.Categorical(base['Tier'], categories=TIERS).codes
+    fee_vec = np.array([tier_fee[t] for t in TIERS] + [np.nan])[tier_codes]
+    vol_vec = np.array([tier_vol[t] for t in TIERS] + [np.nan])[tier_codes]
+
+    curr_rev = base['Estimated_Annual_Revenue'].to_numpy()
 
     # Compute raw (unclamped) proposed fee, rounded to avoid floating-point
     # false positives (e.g. 0.27 + 0.03 = 0.30000000000000004).
     # A merchant landing exactly at 30% is NOT flagged; only strictly-over is.
-    raw_new_fee        = (sim['Marketplace Fee'] + sim['Tier'].map(tier_fee)).round(6)
-    sim['New Fee']     = raw_new_fee.clip(lower=FEE_FLOOR, upper=FEE_CAP)
-    sim['Fee Capped']  = raw_new_fee > FEE_CAP    # strictly above 30%
-    sim['Fee Floored'] = raw_new_fee < FEE_FLOOR   # strictly below 10%
-
-    sim['New Trips']  = sim['Annualized Trips'] * (1 + sim['Tier'].map(tier_vol))
-    sim['New Rev']    = sim['New Trips'] * sim['Avg. Basket Size'] * sim['New Fee']
-    sim['Rev Delta']  = sim['New Rev'] - sim['Curr Rev']
-    sim['Rev Delta %'] = sim['Rev Delta'] / sim['Curr Rev'] * 100
-
-    return sim, tier_fee, tier_vol
+    raw_new_fee = np.round(base['Marketplace Fee'].to_numpy() + fee_vec, 6)
+    new_fee     = np.clip(raw_new_fee, FEE_FLOOR, FEE_CAP)
+
+    new_trips = base['Annualized Trips'].to_numpy() * (1 + vol_vec)
+    new_rev   = new_trips * base['Avg. Basket Size'].to_numpy() * new_fee
+    rev_delta = new_rev - curr_rev
+
+    derived = {
+        'Curr Rev':    curr_rev,
+        'Fee Chg pp':  fee_vec * 100,   # intended adjustment (pre-clamp)
+        'Vol Lift %':  vol_vec * 100,
+        'Fee Dir':     pd.Categorical.from_codes(
+            np.sign(np.nan_to_num(fee_vec)).astype(np.int8) + 1, categories=FEE_DIRECTIONS
+        ),
+        'New Fee':     new_fee,
+        'Fee Capped':  raw_new_fee > FEE_CAP,     # strictly above 30%
+        'Fee Floored': raw_new_fee < FEE_FLOOR,   # strictly below 10%
+        'New Trips':   new_trips,
+        'New Rev':     new_rev,
+        'Rev Delta':   rev_delta,
+        'Rev Delta %': rev_delta / curr_rev * 100,
+    }
+    return pd.concat([base, pd.DataFrame(derived, index=base.index)], axis=1)
@@ -1,6 +1,12 @@
 """Shared UI helpers — typography, colors, KPI cards, header, sidebar."""
+import re
+from functools import lru_cache
+
 import streamlit as st
 
+from utils.data_loader import load_restaurant_data
+from utils.simulation import SS_DEFAULTS, init_session_state, market_share_pct, simulate_tiers
+
 # ── Brand colors ───────────────────────────────────────────────────────────────
 TIER_COLORS = {
     'S': '#06C167',   # Uber green
@@ -15,8 +21,23 @@ AMBER = '#F9A825'
 GRAY  = '#757575'
 
 # ── Global CSS ─────────────────────────────────────────────────────────────────
+def _minify_css(css: str) -> str:
+    """Strip comments, collapse whitespace and drop it around CSS punctuation (safe for _CSS)."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)          # declarations only — no selector uses ": "
+    return css.replace(';}', '}').strip()
+
+
+# Readable source below; minified once at import (re-sent on every rerun)
 _CSS = """
 <style>
+:root {
+    /* mirror TIER_COLORS and the brand constants above */
+    --tier-s: #06C167; --tier-a: #34A853; --tier-b: #F9A825; --tier-c: #D32F2F;
+    --brand-green: #06C167; --brand-dark: #1A1A1A; --brand-red: #D32F2F; --brand-gray: #757575;
+}
 html, body, [class*="css"], .stMarkdown, .stText,
 .stDataFrame, .stMetric, button, input, select, textarea {
     font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif !important;
@@ -37,12 +58,25 @@ hr { border: none; border-top: 1px solid #E0E0E0 !important; margin: 1.5rem 0; }
 [data-testid="stAlert"] { border-radius: 4px !important; font-size: 13px !important; }
 .dvn-scroller thead th { background-color: #F5F5F5 !important; font-size: 12px !important; font-weight: 600 !important; }
 small, .stCaption { font-size: 12px !important; color: #757575 !important; }
+.mc-subtitle { color: var(--brand-gray); font-size: 14px; margin-bottom: 1.5rem; }
+.mc-table table { border-collapse: collapse; width: 100%; font-size: 14px; margin: 0.5rem 0 1rem 0; }
+.mc-table th, .mc-table td { border: 1px solid #E0E0E0; padding: 0.4rem 0.75rem; text-align: left; vertical-align: top; }
+.mc-table th { background: #F5F5F5; font-weight: 600; }
+.mc-table code { font-size: 13px; }
+.mc-kpi { background: #FAFAFA; border: 1px solid #E0E0E0; border-left: 3px solid var(--brand-green); border-radius: 4px; padding: 1rem 1.2rem; }
+.mc-kpi .mc-kpi-value { font-size: 1.5rem; font-weight: 700; color: var(--brand-dark); margin: 0; line-height: 1.2; }
+.mc-kpi .mc-kpi-label { font-size: 12px; color: var(--brand-gray); margin: 5px 0 0 0; }
 </style>
 """
+_CSS = _minify_css(_CSS)
 
 
 def inject_global_css():
-    """Inject DM Sans font and global styles. Safe to call multiple times."""
+    """
+    Inject global styles. Call exactly once per script run (render_header does,
+    Home calls it directly): Streamlit drops elements a rerun doesn't re-emit,
+    so a once-per-session guard would unstyle every page after the first rerun.
+    """
     st.markdown(_CSS, unsafe_allow_html=True)
 
 
@@ -50,7 +84,7 @@ def render_header():
     """Inject global CSS and render a single-line page-top context strip."""
     inject_global_css()
     st.markdown(
-        "<p style='font-size:11px; color:#757575; margin:0 0 1.5rem 0;"
+        "<p style='font-size:11px; color:var(--brand-gray); margin:0 0 1.5rem 0;"
         "padding-bottom:0.6rem; border-bottom:1px solid #E0E0E0;'>"
         "Uber Eats U-City &mdash; Merchant Optimization Simulator"
         "&nbsp;&nbsp;&middot;&nbsp;&nbsp; Jeremy Dubin"
@@ -59,45 +93,66 @@ def render_header():
     )
 
 
+# Static card styling lives in the .mc-kpi rules of _CSS; only data is sent per card
+_KPI_TEMPLATE = (
+    "<div class='mc-kpi' style='border-left-color:{border}'>"
+    "<p class='mc-kpi-value'>{value}</p>"
+    "<p class='mc-kpi-label'>{label}</p>"
+    "</div>"
+)
+
+
+@lru_cache(maxsize=128)
+def _kpi_html(value: str, label: str, border: str) -> str:
+    """Rendered KPI card HTML — cards repeat identical values across reruns."""
+    return _KPI_TEMPLATE.format_map({'border': border, 'value': value, 'label': label})
+
+
 def kpi_card(col, value: str, label: str, accent: str = None):
     """
     Render a clean white KPI card.
     accent — left-border color (defaults to green).
     """
-    border = accent or GREEN
-    col.markdown(
-        f"<div style='background:#FAFAFA; border:1px solid #E0E0E0;"
-        f"border-left:3px solid {border}; border-radius:4px;"
-        f"padding:1rem 1.2rem;'>"
-        f"<p style='font-size:1.5rem; font-weight:700; color:#1A1A1A; margin:0; line-height:1.2;'>{value}</p>"
-        f"<p style='font-size:12px; color:#757575; margin:5px 0 0 0;'>{label}</p>"
-        f"</div>",
-        unsafe_allow_html=True,
+    col.markdown(_kpi_html(value, label, accent or GREEN), unsafe_allow_html=True)
+
+
+# Bounded: at most 64 scenarios (two floats each) live for up to an hour
+@st.cache_data(max_entries=64, ttl=3600, show_spinner=False)
+def _compute_sidebar_metrics_cached(scenario):
+    """
+    (revenue_delta, market_share_pct) for one scenario — the 8 slider values in
+    SS_DEFAULTS order (pp format). Computed from the argument alone, so the
+    result is safe to share across sessions; a hit skips loading and
+    simulating entirely.
+    """
+    df = load_restaurant_data()
+    if df.empty:   # loader already reported the failure
+        return None, None
+    fee_s, fee_a, fee_b, fee_c, vol_s, vol_a, vol_b, vol_c = scenario
+    sim = simulate_tiers(
+        df,
+        {'S': fee_s / 100, 'A': fee_a / 100, 'B': fee_b / 100, 'C': fee_c / 100},
+        {'S': vol_s / 100, 'A': vol_a / 100, 'B': vol_b / 100, 'C': vol_c / 100},
     )
+    # One column-wise reduction over the three columns instead of three sums
+    curr_trips, new_trips, delta = (
+        sim[['Annualized Trips', 'New Trips', 'Rev Delta']].to_numpy(dtype=float).sum(axis=0)
+    )
+    return delta, market_share_pct(curr_trips, new_trips)
 
 
 def _compute_sidebar_metrics():
-    """Return (revenue_delta, market_share_pct) from current session state."""
-    try:
-        from utils.data_loader import load_restaurant_data
-        from utils.simulation import run_simulation, init_session_state
-        init_session_state()   # ensure keys exist before run_simulation reads them
-        df  = load_restaurant_data()
-        sim, _, _ = run_simulation(df)
-        curr_trips   = sim['Annualized Trips'].sum()
-        new_trips    = sim['New Trips'].sum()
-        trip_chg_pct = (new_trips - curr_trips) / curr_trips * 100
-        delta        = sim['Rev Delta'].sum()
-        mkt_share    = 0.18 * (1 + trip_chg_pct / 100) * 100
-        return delta, mkt_share
-    except Exception:
-        return None, None
+    """
+    Return (revenue_delta, market_share_pct) from current session state,
+    or (None, None) if the merchant data could not be loaded.
+    """
+    init_session_state()   # ensure keys exist before reading the scenario
+    scenario = tuple(st.session_state[k] for k in SS_DEFAULTS)
+    return _compute_sidebar_metrics_cached(scenario)
 
 
 def _sidebar_scenario_labels():
     """Return (fee_line, vol_line) strings reflecting current session-state slider values."""
-    from utils.simulation import SS_DEFAULTS
-
     def _pp(v):
         return f"+{v:g}pp" if v >= 0 else f"{v:g}pp"
 
@@ -119,36 +174,53 @@ def _sidebar_scenario_labels():
     return fee_line, vol_line
 
 
+# Constant colors come from the :root variables in _CSS; {placeholders} filled per render
+_SIDEBAR_METRICS_TPL = (
+    "<div style='margin-bottom:1rem;'>"
+    "<p style='font-size:11px; color:var(--brand-gray); margin:0 0 1px 0; text-transform:uppercase; letter-spacing:0.5px;'>Revenue Delta</p>"
+    "<p style='font-size:1.35rem; font-weight:700; color:{color}; margin:0; line-height:1.2;'>{sign}${delta_m:.1f}M</p>"
+    "</div>"
+    "<div style='margin-bottom:1rem;'>"
+    "<p style='font-size:11px; color:var(--brand-gray); margin:0 0 1px 0; text-transform:uppercase; letter-spacing:0.5px;'>Est. Market Share</p>"
+    "<p style='font-size:1.35rem; font-weight:700; color:var(--brand-dark); margin:0; line-height:1.2;'>{mkt_share:.1f}%</p>"
+    "</div>"
+    "<p style='font-size:11px; color:var(--brand-gray); margin:0.8rem 0 0 0;"
+    "border-top:1px solid #E0E0E0; padding-top:0.6rem; line-height:1.8;'>"
+    "{fee_line}<br>{vol_line}"
+    "</p>"
+)
+
+
+@lru_cache(maxsize=256)
+def _render_sidebar_html(sign, delta_m, mkt_share, color, fee_line, vol_line):
+    """Rendered sidebar metrics block for one (display-precision) scenario."""
+    return _SIDEBAR_METRICS_TPL.format_map(locals())
+
+
 def render_sidebar():
     """Render a clean white sidebar with branding and live scenario metrics."""
     with st.sidebar:
         # ── Brand strip ───────────────────────────────────────────────────────
         st.markdown(
-            f"<div style='padding:0.5rem 0 0.8rem 0; border-bottom:2px solid {GREEN}; margin-bottom:1.2rem;'>"
-            f"<p style='font-size:15px; font-weight:700; color:{DARK}; margin:0; letter-spacing:-0.2px;'>Uber Eats U-City</p>"
-            f"<p style='font-size:12px; color:{GRAY}; margin:3px 0 0 0;'>Jeremy Dubin &nbsp;&middot;&nbsp; DCO I&amp;A</p>"
-            f"</div>",
+            "<div style='padding:0.5rem 0 0.8rem 0; border-bottom:2px solid var(--brand-green); margin-bottom:1.2rem;'>"
+            "<p style='font-size:15px; font-weight:700; color:var(--brand-dark); margin:0; letter-spacing:-0.2px;'>Uber Eats U-City</p>"
+            "<p style='font-size:12px; color:var(--brand-gray); margin:3px 0 0 0;'>Jeremy Dubin &nbsp;&middot;&nbsp; DCO I&amp;A</p>"
+            "</div>",
             unsafe_allow_html=True,
         )
 
         # ── Live scenario metrics ─────────────────────────────────────────────
         delta, mkt_share = _compute_sidebar_metrics()
         if delta is not None:
-            sign  = "+" if delta >= 0 else ""
-            color = GREEN if delta >= 0 else RED
+            # Quantise to display precision first and derive sign/color from the
+            # shown value, so everything that renders the same shares one cache
+            # key (+ 0.0 folds -0.0 into 0.0)
+            delta_m  = round(delta / 1e6, 1) + 0.0
+            share_q  = round(mkt_share, 1)
+            sign  = "+" if delta_m >= 0 else ""
+            color = "var(--brand-green)" if delta_m >= 0 else "var(--brand-red)"
             fee_line, vol_line = _sidebar_scenario_labels()
             st.markdown(
-                f"<div style='margin-bottom:1rem;'>"
-                f"<p style='font-size:11px; color:{GRAY}; margin:0 0 1px 0; text-transform:uppercase; letter-spacing:0.5px;'>Revenue Delta</p>"
-                f"<p style='font-size:1.35rem; font-weight:700; color:{color}; margin:0; line-height:1.2;'>{sign}${delta/1e6:.1f}M</p>"
-                f"</div>"
-                f"<div style='margin-bottom:1rem;'>"
-                f"<p style='font-size:11px; color:{GRAY}; margin:0 0 1px 0; text-transform:uppercase; letter-spacing:0.5px;'>Est. Market Share</p>"
-                f"<p style='font-size:1.35rem; font-weight:700; color:{DARK}; margin:0; line-height:1.2;'>{mkt_share:.1f}%</p>"
-                f"</div>"
-                f"<p style='font-size:11px; color:{GRAY}; margin:0.8rem 0 0 0;"
-                f"border-top:1px solid #E0E0E0; padding-top:0.6rem; line-height:1.8;'>"
-                f"{fee_line}<br>{vol_line}"
-                f"</p>",
+                _render_sidebar_html(sign, delta_m, share_q, color, fee_line, vol_line),
                 unsafe_allow_html=True,
             )